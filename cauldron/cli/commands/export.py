@@ -9,6 +9,7 @@ from cauldron import cli
 from cauldron import environ
 from cauldron.cli.interaction import autocompletion
 from cauldron.environ import Response
+from cauldron.session import projects
 
 NAME = 'export'
 DESCRIPTION = 'Export the current project\'s results html files'
@@ -128,7 +129,11 @@ def execute(
     if append and exists:
         append_to_existing_export(results_path, out_path)
     else:
-        shutil.copytree(results_path, out_path)
+        shutil.copytree(
+            results_path,
+            out_path,
+            ignore=shutil.ignore_patterns(projects.COMPILED_DIRECTORY)
+        )
 
     html_path = os.path.join(out_path, 'project.html')
     with open(html_path, 'r') as f:
@@ -4,11 +4,6 @@ import typing
 from argparse import ArgumentParser  # noqa
 
 from cauldron import environ
-from cauldron import ui
-from cauldron.cli import batcher
-from cauldron.cli.server import run as server_run
-from cauldron.cli.shell import CauldronShell
-from cauldron.invoke import containerized
 
 
 def _pre_run_updater():
@@ -66,6 +61,7 @@ def run_version(args: dict) -> int:
 
 def run_batch(args: dict) -> int:
     """Runs a batch operation for the given arguments."""
+    from cauldron.cli import batcher
     batcher.run_project(
         project_directory=args.get('project_directory'),
         log_path=args.get('logging_path'),
@@ -81,6 +77,7 @@ def run_shell(args: dict) -> int:
     if args.get('project_directory'):
         return run_batch(args)
 
+    from cauldron.cli.shell import CauldronShell
     shell = CauldronShell()
 
     if in_project_directory():
@@ -93,6 +90,7 @@ def run_shell(args: dict) -> int:
 def run_kernel(args: dict) -> int:
     """Runs the kernel sub command"""
     _pre_run_updater()
+    from cauldron.cli.server import run as server_run
     server_run.execute(**args)
     return 0
 
@@ -100,13 +98,21 @@ def run_kernel(args: dict) -> int:
 def run_ui(args: dict) -> int:
     """Runs the ui sub command"""
     _pre_run_updater()
+    from cauldron import ui
     ui.start(**args)
     return 0
 
 
+def run_ui_containerized(args: dict) -> int:
+    """Runs the uidocker sub command."""
+    from cauldron.invoke import containerized
+    return containerized.run_ui(args)
+
+
 def run_view(args: dict) -> int:
     """Runs the view sub command."""
     _pre_run_updater()
+    from cauldron.cli.shell import CauldronShell
     shell = CauldronShell()
     shell.default('view open "{}"'.format(args['path']))
     return 0
@@ -131,7 +137,7 @@ def run(action: str, args: dict) -> int:
         serve=run_kernel,
         version=run_version,
         ui=run_ui,
-        uidocker=containerized.run_ui,
+        uidocker=run_ui_containerized,
         view=run_view,
     )
 
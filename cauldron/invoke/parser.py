@@ -1,9 +1,8 @@
+import functools
 import textwrap
+import typing
 from argparse import ArgumentParser
 
-from cauldron import ui
-from cauldron.cli.server import run as server_run
-
 
 def add_view_action(sub_parser: ArgumentParser) -> ArgumentParser:
     """Populates the sub parser with the view arguments."""
@@ -13,6 +12,7 @@ def add_view_action(sub_parser: ArgumentParser) -> ArgumentParser:
 
 def add_ui_action(sub_parser: ArgumentParser) -> ArgumentParser:
     """Populates the sub parser with the UI kernel/server arguments."""
+    from cauldron import ui
     return ui.create_parser(sub_parser)
 
 
@@ -106,6 +106,7 @@ def add_ui_containerized_action(sub_parser: ArgumentParser) -> ArgumentParser:
 
 def add_kernel_action(sub_parser: ArgumentParser) -> ArgumentParser:
     """Populates the sub parser with the kernel/server arguments"""
+    from cauldron.cli.server import run as server_run
     return server_run.create_parser(sub_parser)
 
 
@@ -142,14 +143,41 @@ def add_shell_action(sub_parser: ArgumentParser) -> ArgumentParser:
     return sub_parser
 
 
-def parse(args: list = None) -> dict:
+#: Sub-command names, including aliases, paired with the function that
+#: populates the sub parser for that sub-command.
+SUB_COMMANDS = (
+    (('shell', 'version'), add_shell_action),
+    (('kernel', 'serve'), add_kernel_action),
+    (('ui',), add_ui_action),
+    (('view',), add_view_action),
+    (('uidocker',), add_ui_containerized_action),
+)
+
+
+def get_command(args: typing.List[str]) -> typing.Optional[str]:
     """
-    Parses the command line arguments and returns a dictionary containing the
-    results.
+    Returns the sub-command name being invoked by the given command line
+    arguments, or None if no sub-command was specified. The top-level parser
+    only has flag arguments, so the first positional argument is always the
+    sub-command.
+    """
+    return next((a for a in args if not a.startswith('-')), None)
 
-    :param args:
-        The command line arguments to parse. If None, the system command line
-        arguments will be used instead.
+
+@functools.lru_cache(maxsize=8)
+def create_parser(command: typing.Optional[str]) -> ArgumentParser:
+    """
+    Creates the cauldron command argument parser in which only the sub parser
+    for the specified sub-command is populated with its arguments. The others
+    are registered as empty stubs so that they still appear in the help
+    display without importing the modules that define their arguments.
+
+    Parsers are cached by sub-command so that repeated parsing within the same
+    process, e.g. during testing, reuses the already constructed parser.
+
+    :param command:
+        Name or alias of the sub-command whose sub parser should be populated.
+        If None, no sub parsers will be populated.
     """
     parser = ArgumentParser(description='Cauldron command')
 
@@ -167,13 +195,25 @@ def parse(args: list = None) -> dict:
         description='The actions you can execute with the cauldron command',
     )
 
-    sub_parsers.add_parser('shell', aliases=['version'])
-    add_shell_action(sub_parsers.add_parser('shell'))
-    add_kernel_action(sub_parsers.add_parser('kernel', aliases=['serve']))
-    add_ui_action(sub_parsers.add_parser('ui'))
-    add_view_action(sub_parsers.add_parser('view'))
-    add_ui_containerized_action(sub_parsers.add_parser('uidocker'))
+    for names, add_action in SUB_COMMANDS:
+        sub_parser = sub_parsers.add_parser(names[0], aliases=names[1:])
+        if command in names:
+            add_action(sub_parser)
+
+    return parser
+
+
+def parse(args: list = None) -> dict:
+    """
+    Parses the command line arguments and returns a dictionary containing the
+    results.
 
-    arguments = vars(parser.parse_args(args=args or ['shell']))
+    :param args:
+        The command line arguments to parse. If None, the system command line
+        arguments will be used instead.
+    """
+    args = args or ['shell']
+    parser = create_parser(get_command(args))
+    arguments = vars(parser.parse_args(args=args))
     arguments['parser'] = parser
     return arguments
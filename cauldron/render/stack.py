@@ -1,9 +1,36 @@
+import linecache
 import sys
 import traceback
 
 from cauldron import environ
 from cauldron.session import projects
 
+_CAULDRON_PATH = environ.paths.package()
+_RESOURCES_PATH = environ.paths.resources()
+
+
+def walk_error_frames(error_traceback) -> list:
+    """
+    Returns a list of frame summaries for the given traceback without reading
+    the source lines for them. Unlike traceback.extract_tb, the source line of
+    each frame is only loaded when it is accessed, which avoids reading source
+    files for frames that end up being pruned from the stack. As with
+    traceback.extract_tb, the module loader of each frame is registered with
+    the line cache so that sources only available through a loader, e.g.
+    from zip archives, can still be loaded.
+    """
+    frames = []
+    for frame, line_number in traceback.walk_tb(error_traceback):
+        filename = frame.f_code.co_filename
+        linecache.lazycache(filename, frame.f_globals)
+        frames.append(traceback.FrameSummary(
+            filename,
+            line_number,
+            frame.f_code.co_name,
+            lookup_line=False
+        ))
+    return frames
+
 
 def get_stack_frames(error_stack: bool = True) -> list:
     """
@@ -11,25 +38,28 @@ def get_stack_frames(error_stack: bool = True) -> list:
     Cauldron code where the relevant information resides.
     """
 
-    cauldron_path = environ.paths.package()
-    resources_path = environ.paths.resources()
     frames = (
-        list(traceback.extract_tb(sys.exc_info()[-1]))
+        walk_error_frames(sys.exc_info()[-1])
         if error_stack else
-        traceback.extract_stack()
-    ).copy()
-
-    def is_cauldron_code(test_filename: str) -> bool:
-        if not test_filename or not test_filename.startswith(cauldron_path):
-            return False
-
-        if test_filename.startswith(resources_path):
-            return False
-
-        return True
+        list(traceback.extract_stack())
+    )
 
-    while len(frames) > 1 and is_cauldron_code(frames[0].filename):
-        frames.pop(0)
+    # Skip leading frames from cauldron internals, but keep frames from the
+    # resources directory where the example and step test code resides.
+    index = 0
+    while (
+        index < len(frames) - 1
+        and frames[index].filename
+        and frames[index].filename.startswith(_CAULDRON_PATH)
+        and not frames[index].filename.startswith(_RESOURCES_PATH)
+    ):
+        index += 1
+    frames = frames[index:]
+
+    # Step files are commonly modified between runs, so the line cache is
+    # refreshed for the remaining frames before their source lines are read.
+    for frame in frames:
+        linecache.checkcache(frame.filename)
 
     return frames
 
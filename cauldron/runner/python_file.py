@@ -1,10 +1,13 @@
-import codecs
+import contextlib
 import functools
+import hashlib
+import marshal
 import os
 import threading
 import types
 import typing
 from importlib.abc import InspectLoader
+from importlib.util import MAGIC_NUMBER
 
 from cauldron import environ
 from cauldron import templating
@@ -12,6 +15,25 @@ from cauldron.cli import threads
 from cauldron.render import stack as render_stack
 from cauldron.session import projects
 
+#: Executed after every step file to force the display to flush the print
+#: buffer and breathe the step to open things up for resolution. This
+#: shouldn't be necessary, but it seems there's an async race condition with
+#: print buffers that is hard to reproduce and so this is in place to fix the
+#: problem. It is compiled once and executed in the step module namespace
+#: after the step code instead of being appended to every step source.
+FOOTER_CODE = compile(
+    'import cauldron as __cauldron__\n'
+    '__cauldron__.display.whitespace(0)\n'
+    '__cauldron__.step.breathe()\n',
+    '<cauldron-footer>',
+    'exec'
+)
+
+
+#: Maximum number of compiled step files kept within a compile cache
+#: directory before the least recently written ones are removed.
+MAX_COMPILED_FILES = 256
+
 
 class UserAbortError(Exception):
     """
@@ -26,20 +48,23 @@ class UserAbortError(Exception):
         self.halt = halt
 
 
-def set_executing(on: bool):
+@contextlib.contextmanager
+def executing():
     """
-    Toggle whether or not the current thread is executing a step file. This
-    will only apply when the current thread is a CauldronThread. This function
-    has no effect when run on a Main thread.
-
-    :param on:
-        Whether or not the thread should be annotated as executing a step file.
+    Annotates the current thread as executing a step file for the duration
+    of the context. This will only apply when the current thread is a
+    CauldronThread and has no effect when run on a Main thread.
     """
-
     my_thread = threading.current_thread()
+    if not isinstance(my_thread, threads.CauldronThread):
+        yield
+        return
 
-    if isinstance(my_thread, threads.CauldronThread):
-        my_thread.is_executing = on
+    my_thread.is_executing = True
+    try:
+        yield
+    finally:
+        my_thread.is_executing = False
 
 
 def get_file_contents(source_path: str) -> str:
@@ -54,7 +79,11 @@ def get_file_contents(source_path: str) -> str:
         Path of the step file to load.
     """
     open_funcs = [
-        functools.partial(codecs.open, source_path, encoding='utf-8'),
+        functools.partial(
+            open, source_path, 'r',
+            encoding='utf-8',
+            buffering=65536
+        ),
         functools.partial(open, source_path, 'r')
     ]
 
@@ -71,21 +100,162 @@ def get_file_contents(source_path: str) -> str:
     )
 
 
-def load_step_file(source_path: str) -> str:
+def _read_compiled(
+        cache_path: str,
+        header: bytes
+) -> typing.Optional[types.CodeType]:
+    """
+    Loads the marshalled code object stored in the compile cache file at the
+    given path if that file exists and starts with the expected header.
+    Otherwise None is returned.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            if f.read(len(header)) != header:
+                return None
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def _write_compiled(cache_path: str, header: bytes, code: types.CodeType):
+    """
+    Stores the code object in the compile cache file at the given path. The
+    file is written to a temporary location first and then moved into place
+    so that other processes never read a partially written file. Failures
+    are ignored as the compile cache is only an optimization, but any
+    partially written temporary file is removed.
+    """
+    temp_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            f.write(header)
+            marshal.dump(code, f)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+
+
+def _evict_compiled(cache_directory: str):
+    """
+    Removes the least recently written compiled step files from the given
+    compile cache directory when it holds more than the maximum number of
+    files, which keeps entries for removed or renamed steps from piling up.
     """
-    Loads the source for a step file at the given path location and then
-    renders it in a template to add additional footer data.
-
-    The footer is used to force the display to flush the print buffer and
-    breathe the step to open things up for resolution. This shouldn't be
-    necessary, but it seems there's an async race condition with print
-    buffers that is hard to reproduce and so this is in place to fix the
-    problem.
+    try:
+        with os.scandir(cache_directory) as entries:
+            cached = [
+                (entry.stat().st_mtime, entry.path)
+                for entry in entries
+                if entry.name.endswith('.pyc')
+            ]
+    except OSError:
+        return
+
+    for _, path in sorted(cached)[:-MAX_COMPILED_FILES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_cached(
+        source_path: str,
+        mtime: typing.Optional[int],
+        size: typing.Optional[int],
+        source_code: str,
+        cache_directory: typing.Optional[str] = None
+) -> types.CodeType:
     """
+    Compiles the step source into a code object, caching the result so that
+    re-running an unmodified step skips the parse and compile work. The
+    modified time and size of the source file are part of the cache key along
+    with the source itself so that any change to the step file results in a
+    fresh compilation.
+
+    When a cache directory is specified, compiled code is also stored there
+    using the same marshal format as __pycache__ files so that it survives
+    process restarts. Those files start with a header made of the Python
+    bytecode magic number and a digest of the source so that they are
+    ignored after the source or the Python version changes.
 
-    return templating.render_template(
-        template_name='embedded-step.py.txt',
-        source_contents=get_file_contents(source_path)
+    :param source_path:
+        Path of the step file, which is used as the filename of the code.
+    :param mtime:
+        Modified time of the step file in nanoseconds, or None if it could
+        not be determined.
+    :param size:
+        Size of the step file in bytes, or None if it could not be determined.
+    :param source_code:
+        The source code of the step file to compile.
+    :param cache_directory:
+        Optional directory in which to persist compiled code between
+        processes.
+    """
+    if not cache_directory:
+        return InspectLoader.source_to_code(source_code, source_path)
+
+    header = MAGIC_NUMBER + hashlib.sha256(
+        source_code.encode('utf-8', errors='surrogatepass')
+    ).digest()
+    cache_path = os.path.join(
+        cache_directory,
+        '{}.pyc'.format(hashlib.sha1(source_path.encode()).hexdigest())
+    )
+
+    code = _read_compiled(cache_path, header)
+    if code is None:
+        code = InspectLoader.source_to_code(source_code, source_path)
+        _write_compiled(cache_path, header, code)
+        _evict_compiled(cache_directory)
+    return code
+
+
+def compile_step_source(
+        source_path: str,
+        source_code: str,
+        cache_directory: str = None
+) -> types.CodeType:
+    """
+    Returns the compiled code object for the given step source, which is
+    retrieved from the compile cache if the step file has not changed since
+    it was last compiled.
+
+    :param source_path:
+        Path of the step file from which the source code was loaded.
+    :param source_code:
+        The source code of the step file to compile.
+    :param cache_directory:
+        Optional directory in which compiled code is persisted so that it
+        can be reused by later processes.
+    """
+    try:
+        st = os.stat(source_path)
+        mtime, size = st.st_mtime_ns, st.st_size
+    except OSError:
+        mtime, size = None, None
+
+    return _compile_cached(
+        source_path,
+        mtime,
+        size,
+        source_code,
+        cache_directory
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _package_name(project_id: str, filename: str) -> str:
+    """
+    Returns the dotted package name for the step with the given filename
+    within the project with the given identifier.
+    """
+    return '.'.join(
+        [project_id.replace('.', '-')] +
+        filename.rsplit('.', 1)[0].split(os.sep)
     )
 
 
@@ -109,17 +279,8 @@ def create_module(
 
     module_name = step.definition.name.rsplit('.', 1)[0]
     target_module = types.ModuleType(module_name)
-
-    dunders = dict(
-        __file__=step.source_path,
-        __package__='.'.join(
-            [project.id.replace('.', '-')] +
-            step.filename.rsplit('.', 1)[0].split(os.sep)
-        )
-    )
-
-    for key, value in dunders.items():
-        setattr(target_module, key, value)
+    target_module.__file__ = step.source_path
+    target_module.__package__ = _package_name(project.id, step.filename)
 
     return target_module
 
@@ -144,50 +305,50 @@ def run(
     """
 
     target_module = create_module(project, step)
-    source_code = load_step_file(step.source_path)
+    source_code = get_file_contents(step.source_path)
 
     try:
-        code = InspectLoader.source_to_code(source_code, step.source_path)
+        code = compile_step_source(
+            step.source_path,
+            source_code,
+            project.compiled_path
+        )
     except SyntaxError as error:
         return render_syntax_error(project, error)
 
-    def exec_test():
-        step.test_locals = dict()
-        step.test_locals.update(target_module.__dict__)
-        exec(code, step.test_locals)
-
-    try:
-        set_executing(True)
-        threads.abort_thread()
+    if environ.modes.has(environ.modes.TESTING):
+        # The module namespace is created fresh for every run, so it is
+        # exposed directly to step tests without copying it.
+        step.test_locals = target_module.__dict__
 
-        if environ.modes.has(environ.modes.TESTING):
-            exec_test()
-        else:
+    with executing():
+        try:
+            threads.abort_thread()
             exec(code, target_module.__dict__)
-        out = {
-            'success': True,
-            'stop_condition': projects.StopCondition(False, False)
-        }
-    except threads.ThreadAbortError:
-        # Raised when a user explicitly aborts the running of the step through
-        # a user-interface action.
-        out = {
-            'success': False,
-            'stop_condition': projects.StopCondition(True, True)
-        }
-    except UserAbortError as error:
-        # Raised when a user explicitly aborts the running of the step using
-        # a cd.step.stop(). This behavior should be considered a successful
-        # outcome as it was intentional on the part of the user that the step
-        # abort running early.
-        out = {
-            'success': True,
-            'stop_condition': projects.StopCondition(True, error.halt)
-        }
-    except Exception as error:
-        out = render_error(project, error)
-
-    set_executing(False)
+            exec(FOOTER_CODE, target_module.__dict__)
+            out = {
+                'success': True,
+                'stop_condition': projects.StopCondition(False, False)
+            }
+        except threads.ThreadAbortError:
+            # Raised when a user explicitly aborts the running of the step
+            # through a user-interface action.
+            out = {
+                'success': False,
+                'stop_condition': projects.StopCondition(True, True)
+            }
+        except UserAbortError as error:
+            # Raised when a user explicitly aborts the running of the step
+            # using a cd.step.stop(). This behavior should be considered a
+            # successful outcome as it was intentional on the part of the
+            # user that the step abort running early.
+            out = {
+                'success': True,
+                'stop_condition': projects.StopCondition(True, error.halt)
+            }
+        except Exception as error:
+            out = render_error(project, error)
+
     return out
 
 
@@ -1,3 +1,4 @@
+from cauldron.session.projects.project import COMPILED_DIRECTORY  # noqa
 from cauldron.session.projects.project import DEFAULT_SCHEME  # noqa
 from cauldron.session.projects.project import Project  # noqa
 from cauldron.session.projects.project import StopCondition  # noqa
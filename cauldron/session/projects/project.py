@@ -16,6 +16,10 @@ from cauldron.session.report import Report
 
 DEFAULT_SCHEME = 'S{{##}}-{{name}}.{{ext}}'
 
+#: Name of the hidden directory within the results path where compiled step
+#: code is cached between runs.
+COMPILED_DIRECTORY = '.compiled'
+
 StopCondition = namedtuple('StopCondition', ['aborted', 'halt'])
 
 
@@ -184,6 +188,15 @@ class Project:
     def results_path(self, value: str):
         self._results_path = environ.paths.clean(value)
 
+    @property
+    def compiled_path(self) -> str:
+        """
+        The path where compiled step code is cached between runs, which
+        resides within the results path so that it is removed along with
+        the project results.
+        """
+        return os.path.join(self.results_path, COMPILED_DIRECTORY)
+
     @property
     def url(self) -> str:
         """
@@ -6,6 +6,7 @@ import time
 import typing
 
 from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
 from jinja2 import FileSystemLoader
 from jinja2 import Template
 from jinja2 import pass_context
@@ -15,7 +16,7 @@ from cauldron import environ
 from cauldron.render import utils
 
 BASE_TIME = time.time()
-JINJA_ENVIRONMENT = Environment()
+JINJA_ENVIRONMENT = Environment(cache_size=-1)
 
 
 @pass_context
@@ -64,6 +65,21 @@ def make_template_uid() -> str:
     )
 
 
+def create_bytecode_cache() -> typing.Optional[FileSystemBytecodeCache]:
+    """
+    Creates a bytecode cache that persists compiled templates so that they
+    do not need to be parsed again in later processes. The cache is stored
+    in Jinja2's default per-user directory within the system temp directory,
+    which keeps it apart from the user's Cauldron app data and project
+    results. If that directory cannot be used, None is returned and
+    templates are only cached in memory.
+    """
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
 def get_environment() -> Environment:
     """
     Returns the jinja2 templating environment updated with the most recent
@@ -80,6 +96,7 @@ def get_environment() -> Environment:
     if not loader:
         env.filters['id'] = get_id
         env.filters['latex'] = get_latex
+        env.bytecode_cache = create_bytecode_cache()
 
     if not loader or resource_path not in loader.searchpath:
         env.loader = FileSystemLoader(resource_path)
@@ -0,0 +1,19 @@
+from cauldron import environ
+
+
+def test_serialize():
+    """Should serialize the current connection state."""
+    remote_connection = environ.RemoteConnection(True, 'fake.url')
+    first = remote_connection.serialize()
+    assert {'active': True, 'url': 'fake.url'}.items() <= first.items()
+    assert not first['sync']['active']
+
+
+def test_serialize_modified():
+    """Should reflect modifications without altering earlier results."""
+    remote_connection = environ.RemoteConnection(True, 'fake.url')
+    first = remote_connection.serialize()
+    remote_connection.sync_starting()
+    second = remote_connection.serialize()
+    assert not first['sync']['active']
+    assert second['sync']['active']
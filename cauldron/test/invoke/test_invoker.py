@@ -124,14 +124,14 @@ def test_no_such_command():
     assert 1 == invoker.run('fake', {'parser': MagicMock()})
 
 
-@patch('cauldron.invoke.invoker.ui.start')
+@patch('cauldron.ui.start')
 def test_run_ui(ui_start: MagicMock):
     """Should start the UI."""
     assert 0 == invoke_utils.run_command('ui --name=123.123.123.123')
     assert 1 == ui_start.call_count
 
 
-@patch('cauldron.invoke.invoker.CauldronShell')
+@patch('cauldron.cli.shell.CauldronShell')
 def test_run_view(shell_constructor: MagicMock):
     """Should launch a view through the UI."""
     shell = MagicMock()
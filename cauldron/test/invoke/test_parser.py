@@ -0,0 +1,69 @@
+import subprocess
+import sys
+import textwrap
+
+from cauldron import environ
+from cauldron.invoke import parser
+from pytest import mark
+
+COMMAND_SCENARIOS = [
+    (['shell'], 'shell'),
+    (['-v'], None),
+    (['-v', 'ui', '--port', '8000'], 'ui'),
+    (['view', 'foo'], 'view'),
+]
+
+
+@mark.parametrize('args, expected', COMMAND_SCENARIOS)
+def test_get_command(args: list, expected: str):
+    """Should return the sub-command being invoked by the arguments."""
+    assert expected == parser.get_command(args)
+
+
+def test_parse_default():
+    """Should parse as the shell sub-command when no args are specified."""
+    result = parser.parse()
+    assert 'shell' == result['command']
+    assert result['project_directory'] is None
+
+
+def test_parse_version_alias():
+    """Should parse the version alias of the shell sub-command."""
+    result = parser.parse(['version'])
+    assert 'version' == result['command']
+
+
+def test_parse_only_invoked_command():
+    """Should only populate arguments for the invoked sub-command."""
+    result = parser.parse(['view', 'foo'])
+    assert 'foo' == result['path']
+    assert 'project_directory' not in result
+
+
+def test_parse_cached_parser():
+    """Should reuse the parser when parsing the same sub-command again."""
+    first = parser.parse(['view', 'foo'])
+    second = parser.parse(['view', 'bar'])
+    assert first['parser'] is second['parser']
+    assert 'bar' == second['path']
+
+
+def test_parse_lazy_imports():
+    """Should not import the UI or kernel modules for other sub-commands."""
+    script = textwrap.dedent(
+        """
+        import sys
+        from cauldron.invoke import invoker
+        from cauldron.invoke import parser
+        parser.parse(['version'])
+        loaded = {'cauldron.ui', 'cauldron.cli.server.run'} & set(sys.modules)
+        print(','.join(sorted(loaded)))
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', script],
+        stdout=subprocess.PIPE,
+        cwd=environ.paths.package('..'),
+        check=True
+    )
+    assert b'' == result.stdout.strip()
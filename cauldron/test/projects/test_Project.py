@@ -73,6 +73,17 @@ class TestProject(scaffolds.ResultsTest):
 
         environ.configs.put(results_directory=results_directory, persists=False)
 
+    def test_compiled_path(self):
+        """Compiled path should reside within the results path"""
+
+        support.create_project(self, 'hagrid')
+        project = cd.project.get_internal_project()
+
+        self.assertEqual(
+            os.path.join(self.results_directory, projects.COMPILED_DIRECTORY),
+            project.compiled_path
+        )
+
     def test_has_no_error(self):
         """Should not have an error"""
 
@@ -0,0 +1,44 @@
+import sys
+from unittest.mock import MagicMock
+
+from cauldron.render import stack
+
+
+def test_walk_error_frames():
+    """Should return frame summaries for the error traceback."""
+    try:
+        raise ValueError('Fake')
+    except ValueError:
+        frames = stack.walk_error_frames(sys.exc_info()[-1])
+
+    assert 1 == len(frames)
+    assert __file__ == frames[0].filename
+    assert 'test_walk_error_frames' == frames[0].name
+    assert "raise ValueError('Fake')" == frames[0].line
+
+
+def test_walk_error_frames_loader():
+    """Should load source lines through the module loader of the frame."""
+    source = "raise ValueError('Fake')\n"
+    loader = MagicMock()
+    loader.get_source.return_value = source
+    module_globals = {'__name__': 'fake_module', '__loader__': loader}
+    try:
+        exec(compile(source, '/fake/fake_module.py', 'exec'), module_globals)
+    except ValueError:
+        frames = stack.walk_error_frames(sys.exc_info()[-1])
+
+    assert '/fake/fake_module.py' == frames[-1].filename
+    assert "raise ValueError('Fake')" == frames[-1].line
+    loader.get_source.assert_called_once_with('fake_module')
+
+
+def test_get_stack_frames():
+    """Should return the error frames outside of cauldron internals."""
+    try:
+        exec(compile('1 / 0', '/fake/S01-step.py', 'exec'), {})
+    except ZeroDivisionError:
+        frames = stack.get_stack_frames()
+
+    assert '/fake/S01-step.py' == frames[-1].filename
+    assert not frames[-1].line, 'Expect no source for a missing file.'
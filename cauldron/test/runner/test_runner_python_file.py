@@ -1,6 +1,7 @@
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+from cauldron.cli import threads
 from cauldron.runner import python_file
 from cauldron.test.support import scaffolds
 
@@ -13,3 +14,109 @@ def test_get_file_contents_failed(functools: MagicMock):
     functools.partial.return_value = func
     result = python_file.get_file_contents('FAKE')
     assert result.startswith('raise IOError(')
+
+
+def test_compile_step_source_cached(tmpdir):
+    """Should reuse the compiled code when the step file is unchanged"""
+    path = tmpdir.join('S01-step.py')
+    path.write('x = 1\n')
+    first = python_file.compile_step_source(str(path), 'x = 1\n')
+    second = python_file.compile_step_source(str(path), 'x = 1\n')
+    assert first is second
+
+
+def test_compile_step_source_changed(tmpdir):
+    """Should recompile the code when the step source has changed"""
+    path = tmpdir.join('S01-step.py')
+    path.write('x = 1\n')
+    first = python_file.compile_step_source(str(path), 'x = 1\n')
+    path.write('x = 12\n')
+    second = python_file.compile_step_source(str(path), 'x = 12\n')
+    assert first is not second
+
+
+def test_get_file_contents(tmpdir):
+    """Should load the utf-8 encoded contents of the file"""
+    path = tmpdir.join('S01-step.py')
+    path.write_text('x = "é"\n', encoding='utf-8')
+    assert 'x = "é"\n' == python_file.get_file_contents(str(path))
+
+
+def test_compile_step_source_persisted(tmpdir):
+    """Should load compiled code persisted by an earlier process"""
+    path = tmpdir.join('S01-step.py')
+    path.write('x = 1\n')
+    cache_directory = str(tmpdir.join('compiled'))
+    first = python_file.compile_step_source(
+        str(path), 'x = 1\n', cache_directory
+    )
+    assert 1 == len(tmpdir.join('compiled').listdir())
+
+    python_file._compile_cached.cache_clear()
+    with patch('cauldron.runner.python_file.InspectLoader') as loader:
+        second = python_file.compile_step_source(
+            str(path), 'x = 1\n', cache_directory
+        )
+
+    assert not loader.source_to_code.called
+    assert first == second
+
+
+def test_compile_step_source_persisted_stale(tmpdir):
+    """Should recompile when the persisted code is for other source"""
+    path = tmpdir.join('S01-step.py')
+    path.write('x = 1\n')
+    cache_directory = str(tmpdir.join('compiled'))
+    python_file.compile_step_source(str(path), 'x = 1\n', cache_directory)
+
+    python_file._compile_cached.cache_clear()
+    path.write('x = 12\n')
+    code = python_file.compile_step_source(
+        str(path), 'x = 12\n', cache_directory
+    )
+    namespace = {}
+    exec(code, namespace)
+    assert 12 == namespace['x']
+
+
+@patch('cauldron.runner.python_file.threading.current_thread')
+def test_executing(current_thread: MagicMock):
+    """Should annotate the cauldron thread as executing within the context"""
+    thread = threads.CauldronThread()
+    current_thread.return_value = thread
+
+    with python_file.executing():
+        assert thread.is_executing
+    assert not thread.is_executing
+
+
+@patch('cauldron.runner.python_file.MAX_COMPILED_FILES', 1)
+def test_compile_step_source_evicted(tmpdir):
+    """Should evict older compiled files beyond the maximum count"""
+    cache_directory = tmpdir.join('compiled')
+    for name in ['S01-first.py', 'S02-second.py']:
+        path = tmpdir.join(name)
+        path.write('x = 1\n')
+        python_file.compile_step_source(
+            str(path), 'x = 1\n', str(cache_directory)
+        )
+
+    assert 1 == len(cache_directory.listdir())
+
+
+@patch('cauldron.runner.python_file.marshal.dump')
+def test_compile_step_source_write_failed(dump: MagicMock, tmpdir):
+    """Should remove the temporary file if unable to write compiled code"""
+    dump.side_effect = OSError
+    path = tmpdir.join('S01-step.py')
+    path.write('x = 1\n')
+    cache_directory = tmpdir.join('compiled')
+    code = python_file.compile_step_source(
+        str(path), 'x = 1\n', str(cache_directory)
+    )
+
+    namespace = {}
+    exec(code, namespace)
+    assert 1 == namespace['x']
+    assert 1 == dump.call_count
+    assert [] == cache_directory.listdir()
@@ -1,4 +1,8 @@
+import os
+import tempfile
 import unittest
+from unittest.mock import MagicMock
+from unittest.mock import patch
 
 from cauldron import templating
 from cauldron import environ
@@ -47,7 +51,15 @@ class TestTemplating(unittest.TestCase):
         )
         self.assertEqual(result, 'hello')
 
-
-
-
-
+    def test_create_bytecode_cache(self):
+        """Should create a bytecode cache in the system temp directory."""
+        with tempfile.TemporaryDirectory() as directory:
+            with patch('tempfile.gettempdir', return_value=directory):
+                result = templating.create_bytecode_cache()
+            self.assertEqual(directory, os.path.dirname(result.directory))
+
+    @patch('cauldron.templating.FileSystemBytecodeCache')
+    def test_create_bytecode_cache_failed(self, bytecode_cache: MagicMock):
+        """Should not create a bytecode cache if the folder is unusable."""
+        bytecode_cache.side_effect = RuntimeError
+        self.assertIsNone(templating.create_bytecode_cache())
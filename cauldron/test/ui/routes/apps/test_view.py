@@ -5,29 +5,40 @@ import flask
 from cauldron.ui import configs
 from cauldron.ui.routes import apps
 from pytest import mark
+from werkzeug import exceptions as werkzeug_exceptions
 
 test_app = flask.Flask(__name__)
 test_app.register_blueprint(apps.blueprint)
 
+_send_from_directory = flask.send_from_directory
+
 
 SCENARIOS = [
-    {'exists': True, 'endpoint': '', 'match': 'index.html'},
-    {'exists': True, 'endpoint': 'foo.js', 'match': 'foo.js'},
+    {'exists': True, 'endpoint': '', 'match': 'index.html', 'max_age': 0},
+    {'exists': True, 'endpoint': 'favicon.ico', 'match': 'favicon.ico',
+     'max_age': 0},
+    {'exists': True, 'endpoint': 'assets/js/app.cf0a4552.js',
+     'match': 'assets/js/app.cf0a4552.js', 'max_age': apps.ASSET_MAX_AGE},
+    {'exists': True, 'endpoint': 'assets/js/app.cf0a4552.js.map',
+     'match': 'assets/js/app.cf0a4552.js.map', 'max_age': apps.ASSET_MAX_AGE},
+    {'exists': True, 'endpoint': 'assets/js/app.js',
+     'match': 'assets/js/app.js', 'max_age': 0},
+    {'exists': True, 'endpoint': 'foo.cf0a4552.js',
+     'match': 'foo.cf0a4552.js', 'max_age': 0},
     {'exists': False, 'endpoint': 'foo.js'},
 ]
 
 
 @mark.parametrize('scenario', SCENARIOS)
-@patch('cauldron.ui.routes.apps.os.path.exists')
-@patch('cauldron.ui.routes.apps.flask.send_file')
+@patch('cauldron.ui.routes.apps.flask.send_from_directory')
 def test_view(
-        flask_send_file: MagicMock,
-        exists: MagicMock,
+        send_from_directory: MagicMock,
         scenario: dict,
 ):
     """Should return app file based on the scenario."""
-    flask_send_file.return_value = flask.Response()
-    exists.return_value = scenario['exists']
+    send_from_directory.return_value = flask.Response()
+    if not scenario['exists']:
+        send_from_directory.side_effect = werkzeug_exceptions.NotFound()
 
     client = test_app.test_client()
     response = client.get('{}/app/{}'.format(
@@ -36,13 +47,52 @@ def test_view(
     ))
 
     code = 200 if scenario['exists'] else 204
-    assert 1 == exists.call_count
+    assert 1 == send_from_directory.call_count
     assert code == response.status_code, """
         Expect the default success response to be returned.
         """
 
     if scenario['exists']:
-        path = flask_send_file.call_args[0][0]
-        assert path.endswith(scenario['match'])
-    else:
-        assert not flask_send_file.called
+        directory, route = send_from_directory.call_args[0]
+        assert apps._APP_ROOT == directory
+        assert scenario['match'] == route
+        max_age = send_from_directory.call_args[1]['max_age']
+        assert scenario['max_age'] == max_age
+
+
+def test_view_favicon():
+    """Should require revalidation of the favicon, which is not hashed."""
+    client = test_app.test_client()
+    response = client.get('{}/app/favicon.ico'.format(configs.ROOT_PREFIX))
+    assert 200 == response.status_code
+    assert 0 == response.cache_control.max_age
+
+
+@patch('cauldron.ui.routes.apps.flask.send_from_directory')
+def test_view_outside(send_from_directory: MagicMock):
+    """Should not return files outside of the app directory."""
+    errors = []
+
+    def send_and_record(*args, **kwargs):
+        try:
+            return _send_from_directory(*args, **kwargs)
+        except werkzeug_exceptions.NotFound as error:
+            errors.append(error)
+            raise
+
+    send_from_directory.side_effect = send_and_record
+
+    client = test_app.test_client()
+    response = client.get('{}/app/../../__init__.py'.format(
+        configs.ROOT_PREFIX
+    ))
+
+    assert 204 == response.status_code
+    assert not response.data
+    assert 1 == send_from_directory.call_count
+    directory, route = send_from_directory.call_args[0]
+    assert apps._APP_ROOT == directory
+    assert '../../__init__.py' == route
+    assert 1 == len(errors), """
+        Expect the path to be rejected by send_from_directory itself.
+        """
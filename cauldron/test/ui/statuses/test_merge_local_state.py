@@ -1,7 +1,33 @@
+import ntpath
+import os
+import typing
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+from cauldron import environ
 from cauldron.ui import statuses
+from cauldron.ui.statuses import _reconciler
+from pytest import mark
+
+
+def _create_step_file(directory, name: str = 'bar.py') -> str:
+    """Creates an unmodified step file and returns its path."""
+    path = directory.join(name)
+    path.write('')
+    os.utime(str(path), (0, 0))
+    return str(path)
+
+
+def _create_remote_status(paths: typing.List[str]) -> dict:
+    """Creates a remote status with a step for each of the given paths."""
+    steps = [
+        {
+            'remote_source_path': path,
+            'status': {'name': os.path.basename(path)}
+        }
+        for path in paths
+    ]
+    return {'data': {'project': {'steps': steps}}}
 
 
 def test_merge_local_state_no_project():
@@ -24,25 +50,18 @@ def test_merge_local_state_no_project():
         """
 
 
-@patch('os.path.exists')
-@patch('os.path.getmtime')
-def test_merge_local_state(
-        getmtime: MagicMock,
-        path_exists: MagicMock
-):
+@patch.object(environ.remote_connection, 'active', True)
+def test_merge_local_state(tmpdir):
     """Should merge local state into a remote status response."""
-    getmtime.side_effect = [-1000, FileNotFoundError]
-    path_exists.side_effect = [True, False]
-
-    project_data = {
-        'steps': [
-            # This step will not be modified because there's no status info.
-            {'remote_source_path': 'foo', 'status': {}},
-            {'remote_source_path': 'bar', 'status': {'name': 'bar'}},
-            {'remote_source_path': 'baz', 'status': {'name': 'bax'}},
-        ]
-    }
-    remote_status = {'data': {'project': project_data}}
+    remote_status = _create_remote_status([
+        _create_step_file(tmpdir),
+        str(tmpdir.join('baz.py')),
+    ])
+    # This step will not be modified because there's no status info.
+    remote_status['data']['project']['steps'].insert(0, {
+        'remote_source_path': str(tmpdir.join('foo.py')),
+        'status': {}
+    })
     response = statuses.merge_local_state(remote_status, True)
 
     assert response['hash'].startswith('forced-'), """
@@ -57,3 +76,131 @@ def test_merge_local_state(
         modified, and third to be True because the local file does
         not exist.
         """
+
+
+@patch.object(environ.remote_connection, 'active', True)
+def test_merge_local_state_many_directories(tmpdir):
+    """Should localize the dirty state of steps in many directories."""
+    paths = [
+        _create_step_file(tmpdir.mkdir('d{}'.format(i)), 'S01.py')
+        for i in range(5)
+    ]
+    paths.append(str(tmpdir.join('missing', 'S01.py')))
+
+    remote_status = _create_remote_status(paths)
+    response = statuses.merge_local_state(remote_status, False)
+
+    steps = response['data']['project']['steps']
+    assert paths == [s['remote_source_path'] for s in steps]
+    assert [False] * 5 + [True] == [s['status']['is_dirty'] for s in steps]
+
+
+@mark.parametrize('count', [
+    _reconciler.CONCURRENT_STEPS_THRESHOLD,
+    _reconciler.CONCURRENT_STEPS_THRESHOLD + 1,
+])
+@patch.object(environ.remote_connection, 'active', True)
+@patch('cauldron.ui.statuses._reconciler._executor')
+def test_merge_local_state_concurrent(
+        executor: MagicMock,
+        count: int,
+        tmpdir
+):
+    """Should use the thread pool only for projects with many steps."""
+    paths = [
+        _create_step_file(tmpdir, 'S0{}.py'.format(i))
+        for i in range(count)
+    ]
+    remote_status = _create_remote_status(paths)
+    executor.map.side_effect = map
+    with patch('os.name', 'posix'):
+        response = statuses.merge_local_state(remote_status, False)
+
+    steps = response['data']['project']['steps']
+    assert [False] * count == [s['status']['is_dirty'] for s in steps]
+    expected = count > _reconciler.CONCURRENT_STEPS_THRESHOLD
+    assert expected == executor.map.called, """
+        Expect the single directory of steps to be stat-ed in the thread
+        pool only when there are more steps than the threshold.
+        """
+
+
+@patch('os.stat')
+def test_merge_local_state_inactive(os_stat: MagicMock):
+    """Should not localize step state without an active remote connection."""
+    remote_status = _create_remote_status(['bar'])
+    response = statuses.merge_local_state(remote_status, False)
+
+    steps = response['data']['project']['steps']
+    assert 'is_dirty' not in steps[0]['status']
+    assert not os_stat.called
+
+
+@patch.object(environ.remote_connection, 'active', True)
+@patch('os.scandir')
+def test_merge_local_state_posix(scandir: MagicMock, tmpdir):
+    """Should stat step files individually on non-Windows platforms."""
+    remote_status = _create_remote_status([_create_step_file(tmpdir)])
+    with patch('os.name', 'posix'):
+        response = statuses.merge_local_state(remote_status, False)
+
+    steps = response['data']['project']['steps']
+    assert not steps[0]['status']['is_dirty']
+    assert not scandir.called
+
+
+@patch.object(environ.remote_connection, 'active', True)
+@patch('cauldron.ui.statuses._reconciler._executor')
+@patch('os.scandir')
+def test_merge_local_state_posix_concurrent(
+        scandir: MagicMock,
+        executor: MagicMock,
+        tmpdir
+):
+    """Should stat many step files in one directory concurrently."""
+    paths = [
+        _create_step_file(tmpdir, 'S0{}.py'.format(i))
+        for i in range(5)
+    ]
+    paths.append(str(tmpdir.join('missing.py')))
+
+    remote_status = _create_remote_status(paths)
+    executor.map.side_effect = map
+    with patch('os.name', 'posix'):
+        response = statuses.merge_local_state(remote_status, False)
+
+    steps = response['data']['project']['steps']
+    assert [False] * 5 + [True] == [s['status']['is_dirty'] for s in steps]
+    executor.map.assert_called_once_with(_reconciler._get_modified_time, paths)
+    assert not scandir.called
+
+
+@patch.object(environ.remote_connection, 'active', True)
+def test_merge_local_state_windows_case(tmpdir):
+    """Should match step files case-insensitively when scanning on Windows."""
+    _create_step_file(tmpdir, 'S01-Bar.py')
+    remote_status = _create_remote_status([str(tmpdir.join('s01-bar.py'))])
+    with patch('os.name', 'nt'), patch('os.path.normcase', ntpath.normcase):
+        response = statuses.merge_local_state(remote_status, False)
+
+    steps = response['data']['project']['steps']
+    assert not steps[0]['status']['is_dirty'], """
+        Expect the step to be found despite the filename case mismatch.
+        """
+
+
+@patch.object(environ.remote_connection, 'active', True)
+@patch('os.scandir')
+def test_merge_local_state_unscannable(scandir: MagicMock, tmpdir):
+    """Should stat step files individually if unable to scan directory."""
+    scandir.side_effect = PermissionError
+    remote_status = _create_remote_status([
+        _create_step_file(tmpdir),
+        str(tmpdir.join('baz.py')),
+    ])
+    with patch('os.name', 'nt'):
+        response = statuses.merge_local_state(remote_status, False)
+
+    steps = response['data']['project']['steps']
+    assert [False, True] == [s['status']['is_dirty'] for s in steps]
+    assert scandir.called
@@ -1,9 +1,10 @@
-import mimetypes
 import os
+import re
 
 import cauldron
 import flask
 from cauldron.ui import configs as ui_configs
+from werkzeug import exceptions as werkzeug_exceptions
 
 blueprint = flask.Blueprint(
     name='app',
@@ -11,13 +12,32 @@ blueprint = flask.Blueprint(
     url_prefix='{}/app'.format(ui_configs.ROOT_PREFIX)
 )
 
+#: Browser cache lifetime in seconds for content hashed app resources.
+#: Their names change whenever their contents do, so they can be cached
+#: indefinitely.
+ASSET_MAX_AGE = 31536000
 
-def _get_app_path(route: str) -> str:
-    """Returns application resource path."""
-    return os.path.realpath(os.path.join(
-        os.path.dirname(cauldron.__file__),
-        'resources', 'app', *route.split('/')
-    ))
+#: Matches file names containing the content hash segment that the app
+#: build adds, e.g. ``app.cf0a4552.js`` or ``app.cf0a4552.js.map``.
+_HASHED_NAME_PATTERN = re.compile(r'\.[0-9a-f]{8}(\.[^./]+)+$')
+
+_APP_ROOT = os.path.realpath(os.path.join(
+    os.path.dirname(cauldron.__file__),
+    'resources', 'app'
+))
+
+
+def _get_max_age(route: str) -> int:
+    """
+    Returns the browser cache lifetime for the given route. Only content
+    hashed files are cached. Everything else, e.g. index.html, which points
+    at the hashed assets of the current build, is always revalidated.
+    """
+    is_hashed = (
+        route.startswith('assets/')
+        and _HASHED_NAME_PATTERN.search(route) is not None
+    )
+    return ASSET_MAX_AGE if is_hashed else 0
 
 
 @blueprint.route('/', defaults={'route': 'index.html'}, methods=['GET'])
@@ -27,12 +47,12 @@ def view(route: str):
     Retrieves the contents of the file specified by the view route if it
     exists.
     """
-    path = _get_app_path(route)
-    if not os.path.exists(path):
+    try:
+        return flask.send_from_directory(
+            _APP_ROOT,
+            route,
+            conditional=True,
+            max_age=_get_max_age(route)
+        )
+    except werkzeug_exceptions.NotFound:
         return '', 204
-
-    return flask.send_file(
-        path,
-        mimetype=mimetypes.guess_type(path)[0],
-        cache_timeout=-1
-    )
@@ -1,11 +1,128 @@
 import os
+import typing
+from concurrent.futures import ThreadPoolExecutor
 
 from cauldron import environ
 from cauldron.ui import configs as ui_configs
 from cauldron.ui.statuses import _utils
 
+#: Projects with more step files than this will have them stat-ed
+#: concurrently, which pays off when those files live on slow or
+#: networked file systems.
+CONCURRENT_STEPS_THRESHOLD = 4
 
-def _mark_dirty_after(step_data: dict, timestamp: float) -> dict:
+_executor = ThreadPoolExecutor(max_workers=8)
+
+
+def _get_modified_time(path: str) -> typing.Optional[float]:
+    """
+    Returns the modified time of the file at the given path or None if
+    the file does not exist or cannot be stat-ed.
+    """
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _stat_modified_times(
+        paths: typing.List[str],
+        concurrent: bool = True
+) -> typing.Dict[str, float]:
+    """
+    Returns the modified times of the files that exist at the given paths
+    by stat-ing each of them. When there are more paths than the
+    concurrency threshold, they are stat-ed in the shared thread pool
+    unless concurrent is False.
+    """
+    if concurrent and len(paths) > CONCURRENT_STEPS_THRESHOLD:
+        results = _executor.map(_get_modified_time, paths)
+    else:
+        results = [_get_modified_time(p) for p in paths]
+
+    return {
+        path: modified
+        for path, modified in zip(paths, results)
+        if modified is not None
+    }
+
+
+def _scan_directory_modified_times(
+        directory: str,
+        files: typing.Dict[str, str]
+) -> typing.Dict[str, float]:
+    """
+    Returns the modified times of the files that exist within the given
+    directory by scanning it once, which is only done on Windows where the
+    entries returned by os.scandir already include their stat results. If
+    the directory cannot be scanned, each file is stat-ed individually.
+
+    :param directory:
+        Directory in which the files reside.
+    :param files:
+        Maps the names of the files within the directory to the paths by
+        which they will be identified in the returned dictionary.
+    :return:
+        A dictionary mapping the paths of the files that exist to their
+        modified times.
+    """
+    # Names are normalized because Windows file systems are case
+    # insensitive and step filenames may differ in case from the disk.
+    names = {os.path.normcase(n): p for n, p in files.items()}
+    try:
+        with os.scandir(directory or os.curdir) as entries:
+            return {
+                names[os.path.normcase(entry.name)]: entry.stat().st_mtime
+                for entry in entries
+                if os.path.normcase(entry.name) in names
+            }
+    except OSError:
+        # This may already run within the thread pool, so the fallback
+        # stats are not submitted to it again.
+        return _stat_modified_times(list(files.values()), concurrent=False)
+
+
+def _get_modified_times(paths: typing.List[str]) -> typing.Dict[str, float]:
+    """
+    Returns the modified times of the files that exist at the given paths.
+    On Windows, paths are grouped by their parent directory so that each
+    directory only needs to be scanned once, and multiple directories are
+    scanned concurrently. Elsewhere, scanning offers no savings over
+    stat-ing the files themselves, which is done concurrently for larger
+    projects.
+    """
+    if os.name != 'nt':
+        return _stat_modified_times(paths)
+
+    directories = {}
+    for path in paths:
+        directory, name = os.path.split(path)
+        directories.setdefault(directory, {})[name] = path
+
+    if len(directories) > 1:
+        results = _executor.map(
+            _scan_directory_modified_times,
+            directories.keys(),
+            directories.values()
+        )
+    else:
+        results = [
+            _scan_directory_modified_times(directory, files)
+            for directory, files in directories.items()
+        ]
+
+    return {
+        path: modified
+        for result in results
+        for path, modified in result.items()
+    }
+
+
+def _mark_dirty_after(
+        step_data: dict,
+        timestamp: float,
+        modified_times: typing.Dict[str, float]
+) -> dict:
     """
     Modifies the step_data to mark it dirty if the step data is for
     a remote project and the remote file (on the local system) has
@@ -17,22 +134,16 @@ def _mark_dirty_after(step_data: dict, timestamp: float) -> dict:
     if not path or not status:
         return step_data
 
-    try:
-        file_modified = os.path.getmtime(path)
-    except FileNotFoundError:
-        file_modified = 0
+    exists = path in modified_times
+    file_modified = modified_times.get(path, 0)
 
     is_dirty = (
         status.get('dirty', False)
-        or not os.path.exists(path)
+        or not exists
         or timestamp < file_modified
     )
-    step_data.update(dirty=is_dirty)
-    status.update(
-        dirty=is_dirty,
-        is_dirty=is_dirty,
-        file_modified=file_modified
-    )
+    step_data['dirty'] = status['dirty'] = status['is_dirty'] = is_dirty
+    status['file_modified'] = file_modified
     return step_data
 
 
@@ -41,7 +152,8 @@ def localize_dirty_steps(project_data: dict) -> dict:
     Will mark steps as dirty, even if the remote status says they
     are not if the local files have been modified more recently
     than the remote sync timestamp, i.e. a step needs to be synced
-    to the remote.
+    to the remote. Without an active remote connection there are no
+    local files to compare and the project data is returned as-is.
 
     :param project_data:
         Remote response kernel-serialized project data in which
@@ -49,13 +161,19 @@ def localize_dirty_steps(project_data: dict) -> dict:
     :return:
         The modified kernel-serialized project data.
     """
-    if not project_data:
+    if not project_data or not environ.remote_connection.active:
         return project_data
 
     last_timestamp = environ.remote_connection.sync_timestamp
+    steps = project_data.get('steps') or []
+    modified_times = _get_modified_times([
+        s['remote_source_path']
+        for s in steps
+        if s.get('remote_source_path') and s.get('status')
+    ])
     project_data['steps'] = [
-        _mark_dirty_after(s, last_timestamp)
-        for s in project_data.get('steps') or []
+        _mark_dirty_after(s, last_timestamp, modified_times)
+        for s in steps
     ]
     return project_data
 